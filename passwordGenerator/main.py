@@ -1,4 +1,4 @@
-import random
+import secrets
 import string
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -13,6 +13,21 @@ MIN_PASSWORD_LENGTH = 8
 MAX_PASSWORD_LENGTH = 128
 WIDGET_ANCHOR: Literal["nw", "n", "ne", "w", "center", "e", "sw", "s", "se"] = "w"
 
+# Character sets ordered by their bit in the checkbox selection mask
+_CHARSETS = (NUMBERS, SYMBOLS, UPPERCASE_LETTERS, LOWERCASE_LETTERS)
+# Selected sets and their concatenation for each of the 16 checkbox combinations
+_SETS_BY_MASK = tuple(
+    tuple(charset for bit, charset in enumerate(_CHARSETS) if mask >> bit & 1)
+    for mask in range(1 << len(_CHARSETS))
+)
+_ALL_CHARS_BY_MASK = tuple("".join(sets) for sets in _SETS_BY_MASK)
+
+# Cryptographically secure RNG backed by the OS entropy source
+_RNG = secrets.SystemRandom()
+
+# Last enabled state applied to the Generate button (None until first update)
+_last_btn_enabled = [None]
+
 # UI Labels and Messages
 GUI_TITLE = "Password Generator"
 GUI_DIMENSIONS = "320x360"
@@ -34,75 +49,76 @@ def show_error_message(title, message):
     messagebox.showerror(title, message)
 
 
-def get_active_character_sets():
-    """Returns active character sets based on selected checkboxes."""
-    preferences = {
-        "include_numbers": include_numbers.get(),
-        "include_symbols": include_symbols.get(),
-        "include_uppercase_letters": include_uppercase_letters.get(),
-        "include_lowercase_letters": include_lowercase_letters.get(),
-    }
-
-    character_sets = {
-        "include_numbers": NUMBERS,
-        "include_symbols": SYMBOLS,
-        "include_uppercase_letters": UPPERCASE_LETTERS,
-        "include_lowercase_letters": LOWERCASE_LETTERS,
-    }
+def _selection_mask():
+    """Returns a 4-bit mask of the checked boxes, in `_CHARSETS` order."""
+    return (
+        include_numbers.get()
+        | include_symbols.get() << 1
+        | include_uppercase_letters.get() << 2
+        | include_lowercase_letters.get() << 3
+    )
 
-    # Return character sets where the associated checkbox is checked
-    return [character_sets[key] for key, value in preferences.items() if value]
 
+def _collect_selection():
+    """
+    Reads the checkboxes once and derives everything that depends on them.
 
-def get_min_password_length():
-    """Calculates the minimum password length based on active character sets."""
-    selected = [
-        include_numbers.get(),
-        include_symbols.get(),
-        include_uppercase_letters.get(),
-        include_lowercase_letters.get(),
-    ]
-    return max(MIN_PASSWORD_LENGTH, sum(map(bool, selected)))
+    Returns:
+        tuple: Active character sets, their concatenation, and the minimum
+            allowable password length.
+    """
+    mask = _selection_mask()
+    selected_sets = _SETS_BY_MASK[mask]
+    return selected_sets, _ALL_CHARS_BY_MASK[mask], max(MIN_PASSWORD_LENGTH, len(selected_sets))
 
 
-def is_password_length_valid(length_input, min_length):
+def parse_and_validate_length(length_input, min_length):
     """
-    Validates the user-provided password length.
+    Parses and validates the user-provided password length.
 
     Args:
         length_input (str): The password length input.
         min_length (int): The minimum allowable password length.
     Returns:
-        bool: True if the length is valid, else False (and shows an error message).
+        int | None: The parsed length if valid, else None (and shows an error message).
     """
-    if not (length_input.isdigit() and int(length_input) > 0):
+    try:
+        length_int = int(length_input)
+    except ValueError:
+        show_error_message("Error", ERROR_MESSAGE_INVALID_LENGTH)
+        return None
+    if length_int < 1:
         show_error_message("Error", ERROR_MESSAGE_INVALID_LENGTH)
-        return False
-    length_int = int(length_input)
+        return None
     if length_int < min_length:
         show_error_message("Error", ERROR_MESSAGE_MIN_LENGTH)
-        return False
+        return None
     if length_int > MAX_PASSWORD_LENGTH:
         show_error_message("Error", ERROR_MESSAGE_TOO_LARGE)
-        return False
-    return True
+        return None
+    return length_int
 
 
-def generate_password_with_charsets(selected_sets, length):
+def generate_password_with_charsets(selected_sets, length, all_chars=None):
     """
     Generates a password using the selected character sets.
 
     Args:
-        selected_sets (list): Active character sets for the password.
+        selected_sets (tuple): Active character sets for the password.
         length (int): Desired total password length.
+        all_chars (str, optional): Precomputed concatenation of `selected_sets`.
     Returns:
         str: Generated password.
     """
-    required_chars = [random.choice(charset) for charset in selected_sets]
-    all_chars = "".join(selected_sets)
-    remaining_chars = random.choices(all_chars, k=length - len(required_chars))
-    password = required_chars + remaining_chars
-    random.shuffle(password)
+    if all_chars is None:
+        all_chars = "".join(selected_sets)
+    pool_size = len(all_chars)
+    randbelow = secrets.randbelow
+    password = [all_chars[randbelow(pool_size)] for _ in range(length)]
+    # Overwrite distinct random positions so every selected set is represented
+    positions = _RNG.sample(range(length), len(selected_sets))
+    for pos, charset in zip(positions, selected_sets):
+        password[pos] = _RNG.choice(charset)
     return "".join(password)
 
 
@@ -113,22 +129,21 @@ def generate_password(event=None):
     if not length_input:
         show_error_message("Error", "Please provide a valid password length.")
         return
-    min_length = get_min_password_length()
+    selected_sets, all_chars, min_length = _collect_selection()
 
-    if not is_password_length_valid(length_input, min_length):
+    password_length_val = parse_and_validate_length(length_input, min_length)
+    if password_length_val is None:
         return
 
-    selected_sets = get_active_character_sets()
     if not selected_sets:
         show_error_message("Error", ERROR_MESSAGE_NO_CHARSETS)
         return
 
-    password_length_val = int(length_input)
     if password_length_val < len(selected_sets):
         show_error_message("Error", ERROR_MESSAGE_GROUP_MISMATCH)
         return
 
-    generated_password.set(generate_password_with_charsets(selected_sets, password_length_val))
+    generated_password.set(generate_password_with_charsets(selected_sets, password_length_val, all_chars))
 
 
 def copy_to_clipboard():
@@ -148,9 +163,12 @@ def copy_to_clipboard():
 
 def update_generate_button_state(*args):
     """Enables or disables the Generate button based on character set selection."""
-    active_charsets = get_active_character_sets()
-    is_password_length = password_length.get().strip()
-    generate_button.state(["!disabled"] if active_charsets and is_password_length else ["disabled"])
+    enabled = _selection_mask() != 0
+    # Skip the Tk round-trip when the button is already in the desired state
+    if enabled != _last_btn_enabled[0]:
+        generate_button.state(["!disabled"] if enabled else ["disabled"])
+        _last_btn_enabled[0] = enabled
+
 
 def update_copy_button_state(*args):
     """Enables or disables the Copy button based on whether a password is generated."""
@@ -167,18 +185,30 @@ def initialize_gui():
     ttk.Entry(root, textvariable=password_length).pack(**GUI_PADDING)
 
     # Checkbuttons
-    ttk.Checkbutton(root, text="Include Numbers?", variable=include_numbers).pack(
-        anchor=WIDGET_ANCHOR, **GUI_PADDING
-    )
-    ttk.Checkbutton(root, text="Include Symbols?", variable=include_symbols).pack(
-        anchor=WIDGET_ANCHOR, **GUI_PADDING
-    )
-    ttk.Checkbutton(root, text="Include Uppercase Letters?", variable=include_uppercase_letters).pack(
-        anchor=WIDGET_ANCHOR, **GUI_PADDING
-    )
-    ttk.Checkbutton(root, text="Include Lowercase Letters?", variable=include_lowercase_letters).pack(
-        anchor=WIDGET_ANCHOR, **GUI_PADDING
-    )
+    ttk.Checkbutton(
+        root,
+        text="Include Numbers?",
+        variable=include_numbers,
+        command=update_generate_button_state,
+    ).pack(anchor=WIDGET_ANCHOR, **GUI_PADDING)
+    ttk.Checkbutton(
+        root,
+        text="Include Symbols?",
+        variable=include_symbols,
+        command=update_generate_button_state,
+    ).pack(anchor=WIDGET_ANCHOR, **GUI_PADDING)
+    ttk.Checkbutton(
+        root,
+        text="Include Uppercase Letters?",
+        variable=include_uppercase_letters,
+        command=update_generate_button_state,
+    ).pack(anchor=WIDGET_ANCHOR, **GUI_PADDING)
+    ttk.Checkbutton(
+        root,
+        text="Include Lowercase Letters?",
+        variable=include_lowercase_letters,
+        command=update_generate_button_state,
+    ).pack(anchor=WIDGET_ANCHOR, **GUI_PADDING)
 
     # Buttons and Entries
     global generate_button
@@ -195,11 +225,6 @@ def initialize_gui():
 
     # Bind Events
     root.bind("<Return>", generate_password)
-    password_length.trace_add("write", update_generate_button_state)
-    include_numbers.trace_add("write", update_generate_button_state)
-    include_symbols.trace_add("write", update_generate_button_state)
-    include_uppercase_letters.trace_add("write", update_generate_button_state)
-    include_lowercase_letters.trace_add("write", update_generate_button_state)
     update_generate_button_state()
     update_copy_button_state()
 
@@ -1,8 +1,19 @@
-import json
 import time
+from itertools import chain
+
+# Prefer orjson for faster parsing; fall back to the standard library
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 FILE_PATH = "questions.json"
 LIVES = 3
+# Seconds to pause after invalid prompts; 0 disables pacing entirely
+INTERACTIVE_DELAY = 0.0
+
+# Memoized (easy, medium, hard) buckets, filled on first categorize_questions call
+_QUESTIONS_CACHE = None
 
 
 def load_questions():
@@ -17,8 +28,8 @@ def load_questions():
     :return: The loaded questions from the JSON file.
     :rtype: Any
     """
-    with open(FILE_PATH, "r") as file:
-        questions = json.load(file)
+    with open(FILE_PATH, "rb") as file:
+        questions = _json.loads(file.read())
 
     return questions
 
@@ -29,19 +40,30 @@ def categorize_questions():
     This function loads a list of questions and categorizes them into three separate
     lists based on their difficulty level: "easy", "medium", and "hard". Each question
     is assumed to have a "difficulty" key indicating its difficulty as a string
-    (either "easy", "medium", or "hard"). The function returns these categorized lists.
+    (either "easy", "medium", or "hard"); questions with any other difficulty are
+    skipped. Lowercased question and answer texts are stored on each question under
+    "_question_lc" and "_answer_lc", and lowercased options under "_options_lc".
+    The file is only read on the first call; later calls return the cached lists.
 
     :returns: A tuple containing three lists - the first with questions of difficulty
         level "easy", the second with questions of difficulty level "medium", and
         the third with questions of difficulty level "hard".
     :rtype: tuple[list[dict]]
     """
-    questions = load_questions()
-    easy_questions = [q for q in questions if q["difficulty"].lower() == "easy"]
-    medium_questions = [q for q in questions if q["difficulty"].lower() == "medium"]
-    hard_questions = [q for q in questions if q["difficulty"].lower() == "hard"]
-
-    return easy_questions, medium_questions, hard_questions
+    global _QUESTIONS_CACHE
+    if _QUESTIONS_CACHE is None:
+        easy, medium, hard = [], [], []
+        buckets = {"easy": easy, "medium": medium, "hard": hard}
+        for q in load_questions():
+            bucket = buckets.get(q["difficulty"].lower())
+            if bucket is not None:
+                q["_question_lc"] = q["question"].lower()
+                q["_answer_lc"] = q["answer"].lower()
+                q["_options_lc"] = [o.lower() for o in q["options"]]
+                bucket.append(q)
+        _QUESTIONS_CACHE = (easy, medium, hard)
+
+    return _QUESTIONS_CACHE
 
 def game(lives=LIVES):
     """
@@ -55,46 +77,60 @@ def game(lives=LIVES):
     :return: None
     """
     easy, medium, hard = categorize_questions()
-    total_questions = easy + medium + hard
 
-    question_number = 1
-    for question in total_questions:
-        current_question = question["question"].lower()
-        current_answer = question["answer"].lower()
-        current_options = question["options"]
+    while True:
+        # chain objects are single-use, so each round gets a fresh one
+        total_questions = chain(easy, medium, hard)
+        current_lives = lives
+        question_number = 1
+        restart = False
+        for question in total_questions:
+            current_question = question["_question_lc"]
+            current_answer = question["_answer_lc"]
+            current_options = question["options"]
+            current_options_lc = question["_options_lc"]
+
+            print_question(question_number, current_question, current_options)
+            user_answer = take_answer()
+            is_correct = check_answer(user_answer, current_answer, current_options_lc)
 
-        print_question(question_number, current_question, current_options)
-        user_answer = take_answer()
-        is_correct = check_answer(user_answer, current_answer, current_options)
+            while is_correct == "invalid input":
+                print_question(question_number, current_question, current_options)
+                user_answer = take_answer()
+                is_correct = check_answer(user_answer, current_answer, current_options_lc)
 
-        if not is_correct:
-            lives -= 1
             question_number += 1
-            if lives == 0:
-                again = input("You lost!\nDo you want to play again? (y/n): ").lower()
-                while again not in ["y", "n"]:
-                    print("invalid input, try again:")
-                    time.sleep(1)
-                    again = input("Do you want to play again? (y/n): ").lower()
-                if again == "y":
-                    game()
-                else:
+            if not is_correct:
+                current_lives -= 1
+                if current_lives == 0:
+                    if prompt_play_again() == "y":
+                        restart = True
+                        break
                     print("Thanks for playing!")
-                    break
+                    return
 
-            else:
-                print(f"You have {lives} lives left.")
-                continue
+                else:
+                    print(f"You have {current_lives} lives left.")
 
-        while is_correct == "invalid input":
-            print_question(question_number, current_question, current_options)
-            user_answer = take_answer()
-            is_correct = check_answer(user_answer, current_answer, current_options)
+        if not restart:
+            return
 
-        else:
-            question_number += 1
+def prompt_play_again():
+    """
+    Asks the player whether they want to play again until a valid choice is given.
 
-def check_answer(user_answer, correct_answer, options):
+    :return: The player's choice, either "y" or "n".
+    :rtype: str
+    """
+    again = input("You lost!\nDo you want to play again? (y/n): ").lower()
+    while again not in ["y", "n"]:
+        print("invalid input, try again:")
+        if INTERACTIVE_DELAY:
+            time.sleep(INTERACTIVE_DELAY)
+        again = input("Do you want to play again? (y/n): ").lower()
+    return again
+
+def check_answer(user_answer, correct_answer, options_lc):
     """
     Checks the user's answer against the correct answer and provides feedback.
 
@@ -107,26 +143,27 @@ def check_answer(user_answer, correct_answer, options):
     :param user_answer: The input provided by the user, representing the selected
         answer. Must be a string that can be converted to a digit within the valid
         range of options.
-    :param correct_answer: The correct answer to the question as a string.
-    :param options: A list of possible answer options provided to the user.
+    :param correct_answer: The correct answer to the question as a lowercase string.
+    :param options_lc: The lowercased answer options provided to the user, in
+        display order.
 
     :return: Returns True if the user's selected answer is correct, False if the
         selected answer is incorrect. Returns "invalid input" if the user's input
         is not valid.
     """
-    while not user_answer.isdigit() or int(user_answer) > len(options) or int(user_answer) < 1:
+    if not user_answer.isdecimal():
+        print("Enter a valid answer: ")
+        return "invalid input"
+    idx = int(user_answer) - 1
+    if not 0 <= idx < len(options_lc):
         print("Enter a valid answer: ")
-        time.sleep(1)
         return "invalid input"
 
-    user_answer_text = options[int(user_answer) - 1]
-    if user_answer_text.lower() == correct_answer.lower():
+    if options_lc[idx] == correct_answer:
         print("Correct!")
-        time.sleep(1)
         return True
     else:
         print(f"Wrong! The correct answer is {correct_answer}")
-        time.sleep(1)
         return False
 
 def print_question(idx, current_question, current_options):
@@ -134,7 +171,7 @@ def print_question(idx, current_question, current_options):
     Displays the question along with its options.
 
     This function prints the current question number, the question text, and a list
-    of provided options, formatted and enumerated.
+    of provided options, formatted and enumerated, as a single block of output.
 
     :param idx: The index or number of the current question being displayed.
     :type idx: int
@@ -144,9 +181,9 @@ def print_question(idx, current_question, current_options):
     :type current_options: list[str]
     :return: None
     """
-    print(f"Question number {idx}:\n{current_question}\n the options are:")
-    for i, o in enumerate(current_options, start=1):
-        print(f"{i}. {o}")
+    lines = [f"Question number {idx}:", current_question, " the options are:"]
+    lines.extend(f"{i}. {o}" for i, o in enumerate(current_options, start=1))
+    print("\n".join(lines))
 
 def take_answer():
     """